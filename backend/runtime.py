@@ -211,7 +211,7 @@ class RuntimeEngine:
         for sid in self._strategies.keys():
             pos = self._positions.get(sid)
             acc = self._accounts.get(sid)
-            liq = self._portfolio.calc_liq_price(sid, pos.entry_price, pos.side) if pos else None
+            liq = self._portfolio.calc_liq_price(sid, pos.entry_price, pos.is_long) if pos else None
             strategies[sid] = {
                 "balance": acc.balance if acc else None,
                 "equity": acc.equity if acc else None,
@@ -62,11 +62,11 @@ class PortfolioService:
                 acc.free_margin = float(row["free_margin"])
 
     def calc_realized_pnl(self, pos: PositionState, price: float, qty: float) -> float:
-        if pos.side == "LONG":
+        if pos.is_long:
             return (price - pos.entry_price) * qty
         return (pos.entry_price - price) * qty
 
-    def calc_liq_price(self, sid: str, entry_price: float, side: str) -> float:
+    def calc_liq_price(self, sid: str, entry_price: float, is_long: bool) -> float:
         lev = float(self._profiles[sid]["sim"]["max_leverage"])
         pos = self._positions.get(sid)
         qty = pos.qty if pos else 0.0
@@ -75,7 +75,7 @@ class PortfolioService:
         notional_entry = entry_price * qty
         mmr, maint_amt = self._select_mmr(sid, notional_entry)
         margin = notional_entry / lev
-        if side == "LONG":
+        if is_long:
             num = margin - entry_price * qty - maint_amt
             denom = (mmr - 1.0) * qty
             return num / denom if denom != 0 else entry_price
@@ -101,7 +101,7 @@ class PortfolioService:
                 upl = self.calc_realized_pnl(pos, price, pos.qty)
                 notional = pos.qty * price
                 margin_used = notional / float(self._profiles[sid]["sim"]["max_leverage"])
-                liq = self.calc_liq_price(sid, pos.entry_price, pos.side)
+                liq = self.calc_liq_price(sid, pos.entry_price, pos.is_long)
 
             equity = acc.balance + upl
             free_margin = equity - margin_used
@@ -113,7 +113,7 @@ class PortfolioService:
         sid = next(iter(self._accounts.keys()))
         pos = self._positions.get(sid)
         acc = self._accounts[sid]
-        liq = self.calc_liq_price(sid, pos.entry_price, pos.side) if pos else None
+        liq = self.calc_liq_price(sid, pos.entry_price, pos.is_long) if pos else None
         await self._status_store.update(
             balance=acc.balance,
             equity=acc.equity,
@@ -192,7 +192,7 @@ class PortfolioService:
                 continue
             price = price_hint or self._last_price or pos.entry_price
             notional = pos.qty * price
-            pnl = notional * rate * (1 if pos.side == "LONG" else -1)
+            pnl = notional * rate * (1 if pos.is_long else -1)
             self._accounts[strategy_id].balance += pnl
             now_ms = int(time.time() * 1000)
             await self._db.insert_ledger(
@@ -110,7 +110,7 @@ class PositionService:
                 status="OPEN",
                 realized_pnl=0.0,
                 fees_total=fee,
-                liq_price=self._portfolio.calc_liq_price(sid, signal.entry_price, signal.side),
+                liq_price=self._portfolio.calc_liq_price(sid, signal.entry_price, signal.side == "LONG"),
                 created_at=now_ms,
                 updated_at=now_ms,
             )
@@ -228,7 +228,7 @@ class PositionService:
                 strategy=sid,
                 symbol=self._settings.binance.symbol,
                 position_id=pos_id,
-                side="SELL" if pos.side == "LONG" else "BUY",
+                side="SELL" if pos.is_long else "BUY",
                 trade_type="EXIT",
                 price=action.price,
                 qty=qty_to_close,
@@ -258,7 +258,7 @@ class PositionService:
             "sid": sid,
             "trade_id": trade_id,
             "symbol": self._settings.binance.symbol,
-            "side": "SELL" if pos.side == "LONG" else "BUY",
+            "side": "SELL" if pos.is_long else "BUY",
             "trade_type": "EXIT",
             "price": action.price,
             "qty": qty_to_close,
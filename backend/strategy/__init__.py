@@ -1,7 +1,15 @@
-from .interfaces import IStrategy, StrategyContext, EntrySignal, ExitAction, Indicators15m, Indicators1h, PositionState
-from .test_strategy import TestStrategy
-from .ma_cross_strategy import MaCrossStrategy
-from .simple_rsi_overtrade_strategy import SimpleRsiOvertradeStrategy
+import importlib
+
+from .interfaces import (
+    IStrategy,
+    StrategyContext,
+    EntrySignal,
+    ExitAction,
+    IndicatorView,
+    Indicators15m,
+    Indicators1h,
+    PositionState,
+)
 from .profile_loader import build_strategy_profile
 from .registry import create_strategy, get_strategy_defaults, list_strategy_types, register_strategy
 
@@ -10,6 +18,7 @@ __all__ = [
     "StrategyContext",
     "EntrySignal",
     "ExitAction",
+    "IndicatorView",
     "Indicators15m",
     "Indicators1h",
     "PositionState",
@@ -22,3 +31,19 @@ __all__ = [
     "list_strategy_types",
     "register_strategy",
 ]
+
+# built-in strategy classes are imported on first access (see registry._lazy_factory)
+_LAZY_STRATEGIES = {
+    "TestStrategy": ".test_strategy",
+    "MaCrossStrategy": ".ma_cross_strategy",
+    "SimpleRsiOvertradeStrategy": ".simple_rsi_overtrade_strategy",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_STRATEGIES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,37 @@
+"""
+Float-only signal kernels.
+Inputs/outputs are plain floats/ints (missing values as NaN), no ctx/dict access,
+so strategies can call them per bar and batch/backtest code can loop over arrays.
+"""
+
+from __future__ import annotations
+
+import math
+
+
+def ma_cross_entry(
+    close: float,
+    ema20: float,
+    ema60: float,
+    rsi1h: float,
+    atr15: float,
+    structure_stop: float,
+    atr_mult: float,
+) -> tuple[int, float, float, float]:
+    """Return (side, stop, tp1, tp2); side 1=LONG, -1=SHORT, 0=no signal."""
+    if ema20 > ema60 and rsi1h > 50:
+        sgn = 1.0
+    elif ema20 < ema60 and rsi1h < 50:
+        sgn = -1.0
+    else:
+        return 0, math.nan, math.nan, math.nan
+    atr_stop = close - sgn * atr_mult * atr15
+    if math.isnan(structure_stop):
+        stop = atr_stop
+    elif sgn > 0:
+        stop = min(structure_stop, atr_stop)
+    else:
+        stop = max(structure_stop, atr_stop)
+    # close - stop carries the side: positive for LONG, negative for SHORT
+    d = close - stop
+    return int(sgn), stop, close + d, close + 2 * d
@@ -20,6 +20,41 @@ class Indicators1h:
     close: float
 
 
+_VIEW_KEYS = (
+    "close_15m",
+    "ema20_15m",
+    "ema60_15m",
+    "rsi14_15m",
+    "macd_hist_15m",
+    "atr14_15m",
+    "close_1h",
+    "ema20_1h",
+    "ema60_1h",
+    "rsi14_1h",
+)
+
+
+@dataclass(slots=True)
+class IndicatorView:
+    """Attribute access to the well-known indicator keys (missing -> None)."""
+
+    close_15m: Optional[float] = None
+    ema20_15m: Optional[float] = None
+    ema60_15m: Optional[float] = None
+    rsi14_15m: Optional[float] = None
+    macd_hist_15m: Optional[float] = None
+    atr14_15m: Optional[float] = None
+    close_1h: Optional[float] = None
+    ema20_1h: Optional[float] = None
+    ema60_1h: Optional[float] = None
+    rsi14_1h: Optional[float] = None
+
+    @classmethod
+    def from_map(cls, indicators: Dict[str, Any]) -> "IndicatorView":
+        get = indicators.get
+        return cls(*[get(k) for k in _VIEW_KEYS])
+
+
 @dataclass(slots=True)
 class PositionState:
     side: str  # LONG/SHORT
@@ -29,6 +64,11 @@ class PositionState:
     tp1_price: float
     tp2_price: float
     tp1_hit: bool
+    # derived from side so hot paths avoid the string compare
+    is_long: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.is_long = self.side == "LONG"
 
 
 @dataclass(slots=True)
@@ -55,7 +95,16 @@ class StrategyContext:
     history: Dict[str, Any] = field(default_factory=dict)
     meta: Dict[str, Any] = field(default_factory=dict)
 
+    # cached IndicatorView over `indicators`; reset to None whenever indicators are mutated
+    indv: Optional[IndicatorView] = None
+
     # helper accessors
+    def view(self) -> IndicatorView:
+        v = self.indv
+        if v is None:
+            v = self.indv = IndicatorView.from_map(self.indicators)
+        return v
+
     def ind(self, name: str, default=None):
         return self.indicators.get(name, default)
 
@@ -126,11 +175,28 @@ class IStrategy(Protocol):
         """Return {"long":[...], "short":[...]} checklist for UI/stream."""
         ...
 
+    def condition_mask(self, ctx: StrategyContext) -> Optional[tuple]:
+        """
+        Optional: hashable truth-state of the checklist inputs. While it (plus readiness/position/cooldown)
+        is unchanged, the runner reuses the previous describe_conditions result. None = always rebuild.
+        """
+        return None
+
     def on_bar_close(self, ctx: StrategyContext) -> Optional[EntrySignal | ExitAction]:
         ...
 
     def on_tick(self, ctx: StrategyContext, price: float) -> Optional[EntrySignal | ExitAction]:
         ...
 
+    def on_tick_entry(self, ctx: StrategyContext, price: float) -> Optional[EntrySignal]:
+        """Realtime entry check (realtime_entry, no position). Default adapts legacy on_tick."""
+        action = self.on_tick(ctx, price)
+        return action if isinstance(action, EntrySignal) else None
+
+    def on_tick_exit(self, ctx: StrategyContext, price: float) -> Optional[ExitAction]:
+        """Realtime exit check (realtime_exit, open position). Default adapts legacy on_tick."""
+        action = self.on_tick(ctx, price)
+        return action if isinstance(action, ExitAction) else None
+
     def on_state_restore(self, ctx: StrategyContext) -> None:
         ...
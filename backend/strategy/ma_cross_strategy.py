@@ -1,25 +1,26 @@
 from __future__ import annotations
 
+import math
+from functools import lru_cache
+
+from ..indicators import AtrSpec, EmaSpec, RsiSpec
+from ._kernels import ma_cross_entry
 from .interfaces import EntrySignal, ExitAction, IStrategy, StrategyContext
 
 
-def _choose_stop(entry: float, atr: float, structure_stop: float | None, atr_mult: float, side: str) -> float:
-    if side == "LONG":
-        atr_stop = entry - atr_mult * atr
-        return min(structure_stop, atr_stop) if structure_stop is not None else atr_stop
-    atr_stop = entry + atr_mult * atr
-    return max(structure_stop, atr_stop) if structure_stop is not None else atr_stop
+def _cond_item(direction: str, tf: str, ok: bool, desc: str) -> dict:
+    return {"direction": direction, "timeframe": tf, "ok": bool(ok), "desc": desc, "label": f"[{tf}]{desc}"}
 
 
-def _calc_targets(entry: float, stop: float) -> tuple[float, float]:
-    r = abs(entry - stop)
-    tp1 = entry + r if entry > stop else entry - r
-    tp2 = entry + 2 * r if entry > stop else entry - 2 * r
-    return tp1, tp2
+@lru_cache(maxsize=128)
+def _blocked_template(desc: str, tf: str) -> tuple[tuple[dict, ...], tuple[dict, ...]]:
+    return (_cond_item("LONG", tf, False, desc),), (_cond_item("SHORT", tf, False, desc),)
 
 
-def _cond_item(direction: str, tf: str, ok: bool, desc: str) -> dict:
-    return {"direction": direction, "timeframe": tf, "ok": bool(ok), "desc": desc, "label": f"[{tf}]{desc}"}
+def _blocked(desc: str, tf: str) -> dict:
+    # item dicts are shared between calls; consumers (stream/API) only read them
+    long_t, short_t = _blocked_template(desc, tf)
+    return {"long": list(long_t), "short": list(short_t)}
 
 
 class MaCrossStrategy(IStrategy):
@@ -29,13 +30,26 @@ class MaCrossStrategy(IStrategy):
 
     def __init__(self) -> None:
         self._profile = {}
+        self._atr_mult: float | None = None
+        # ema20>ema60 on the previous closed bar; entries fire only when it flips
+        self._prev_cross: bool | None = None
+        self._ind_reqs = self._build_ind_reqs()
+        self._warmup = self._build_warmup_policy()
 
     def configure(self, profile: dict) -> None:
         self._profile = profile or {}
+        self._ind_reqs = self._build_ind_reqs()
+        self._warmup = self._build_warmup_policy()
+        params = self._profile.get("strategy") or {}
+        self._atr_mult = float(params.get("atr_stop_mult", 1.2))
 
     def indicator_requirements(self) -> dict:
-        from ..indicators import EmaSpec, RsiSpec, AtrSpec
+        return self._ind_reqs
 
+    def warmup_policy(self) -> dict:
+        return self._warmup
+
+    def _build_ind_reqs(self) -> list:
         ind = (self._profile.get("indicators") or {})
         ema_fast = ind.get("ema_fast", {}).get("length", 20)
         ema_slow = ind.get("ema_slow", {}).get("length", 60)
@@ -53,7 +67,7 @@ class MaCrossStrategy(IStrategy):
             RsiSpec(name="rsi14_1h", interval="1h", length=rsi_len),
         ]
 
-    def warmup_policy(self) -> dict:
+    def _build_warmup_policy(self) -> dict:
         kc = (self._profile.get("kline_cache") or {})
         return {
             "15m": {"buffer_mult": kc.get("warmup_buffer_mult", 3.0), "extra": kc.get("warmup_extra_bars", 200)},
@@ -61,23 +75,18 @@ class MaCrossStrategy(IStrategy):
         }
 
     def describe_conditions(self, ctx: StrategyContext, ind_1h_ready: bool, has_position: bool, cooldown_bars: int) -> dict:
-        def blocked(desc: str, tf: str) -> dict:
-            return {
-                "long": [_cond_item("LONG", tf, False, desc)],
-                "short": [_cond_item("SHORT", tf, False, desc)],
-            }
-
         if not ind_1h_ready:
-            return blocked("1h指标未就绪", "1h")
+            return _blocked("1h指标未就绪", "1h")
         if has_position:
-            return blocked("已有持仓", "15m")
+            return _blocked("已有持仓", "15m")
         if cooldown_bars > 0:
-            return blocked(f"冷却中({cooldown_bars})", "15m")
+            return _blocked(f"冷却中({cooldown_bars})", "15m")
 
-        ema20 = ctx.ind("ema20_15m") or 0
-        ema60 = ctx.ind("ema60_15m") or 0
-        rsi1h = ctx.ind("rsi14_1h") or 0
-        atr15 = ctx.ind("atr14_15m")
+        iv = ctx.view()
+        ema20 = iv.ema20_15m or 0
+        ema60 = iv.ema60_15m or 0
+        rsi1h = iv.rsi14_1h or 0
+        atr15 = iv.atr14_15m
 
         cond_long = [
             _cond_item("LONG", "15m", ema20 > ema60, "EMA多头"),
@@ -91,60 +100,77 @@ class MaCrossStrategy(IStrategy):
         ]
         return {"long": cond_long, "short": cond_short}
 
+    def condition_mask(self, ctx: StrategyContext) -> tuple:
+        iv = ctx.view()
+        ema20 = iv.ema20_15m or 0
+        ema60 = iv.ema60_15m or 0
+        rsi1h = iv.rsi14_1h or 0
+        return (ema20 > ema60, ema20 < ema60, rsi1h > 50, rsi1h < 50, iv.atr14_15m is not None)
+
     def on_state_restore(self, ctx: StrategyContext) -> None:
-        return
+        iv = ctx.view()
+        ema20 = iv.ema20_15m
+        ema60 = iv.ema60_15m
+        if ema20 is not None and ema60 is not None:
+            self._prev_cross = ema20 > ema60
+
+    def reset_state(self) -> None:
+        """Forget the previous bar's EMA relation (StrategyRunner.reset_strategy)."""
+        self._prev_cross = None
 
     def on_bar_close(self, ctx: StrategyContext) -> EntrySignal | ExitAction | None:
-        ema20 = ctx.ind("ema20_15m")
-        ema60 = ctx.ind("ema60_15m")
-        rsi1h = ctx.ind("rsi14_1h")
-        atr15 = ctx.ind("atr14_15m")
-        params = ctx.meta.get("params") or {}
-        atr_mult = params.get("atr_stop_mult", 1.2)
+        iv = ctx.view()
+        ema20 = iv.ema20_15m
+        ema60 = iv.ema60_15m
+        rsi1h = iv.rsi14_1h
+        atr15 = iv.atr14_15m
+        atr_mult = self._atr_mult
+        if atr_mult is None:
+            atr_mult = (ctx.meta.get("params") or {}).get("atr_stop_mult", 1.2)
+
+        prev_cross = self._prev_cross
+        crossed = False
+        if ema20 is not None and ema60 is not None:
+            now_cross = ema20 > ema60
+            crossed = prev_cross is not None and prev_cross != now_cross
+            self._prev_cross = now_cross
 
         if ctx.position is not None:
             pos = ctx.position
             ema_fast = ema20 or 0
             ema_slow = ema60 or 0
-            if pos.side == "LONG" and ema_fast < ema_slow:
+            if pos.is_long and ema_fast < ema_slow:
                 return ExitAction(action="CLOSE_ALL", price=ctx.close_15m, reason="trend_flip")
-            if pos.side == "SHORT" and ema_fast > ema_slow:
+            if not pos.is_long and ema_fast > ema_slow:
                 return ExitAction(action="CLOSE_ALL", price=ctx.close_15m, reason="trend_flip")
             return None
 
         if ctx.cooldown_bars_remaining > 0:
             return None
 
-        if ema20 is None or ema60 is None or rsi1h is None:
+        if not crossed or rsi1h is None or atr15 is None:
             return None
 
         entry = ctx.close_15m
-        if ema20 > ema60 and rsi1h > 50:
-            stop = _choose_stop(entry, atr15, ctx.structure_stop, atr_mult, "LONG")
-            tp1, tp2 = _calc_targets(entry, stop)
-            return EntrySignal(
-                side="LONG",
-                entry_price=entry,
-                stop_price=stop,
-                tp1_price=tp1,
-                tp2_price=tp2,
-                reason="ma_long",
-            )
-
-        if ema20 < ema60 and rsi1h < 50:
-            stop = _choose_stop(entry, atr15, ctx.structure_stop, atr_mult, "SHORT")
-            tp1, tp2 = _calc_targets(entry, stop)
-            return EntrySignal(
-                side="SHORT",
-                entry_price=entry,
-                stop_price=stop,
-                tp1_price=tp1,
-                tp2_price=tp2,
-                reason="ma_short",
-            )
-
-        return None
+        structure_stop = ctx.structure_stop if ctx.structure_stop is not None else math.nan
+        side, stop, tp1, tp2 = ma_cross_entry(entry, ema20, ema60, rsi1h, atr15, structure_stop, atr_mult)
+        if side == 0:
+            return None
+        return EntrySignal(
+            side="LONG" if side > 0 else "SHORT",
+            entry_price=entry,
+            stop_price=stop,
+            tp1_price=tp1,
+            tp2_price=tp2,
+            reason="ma_long" if side > 0 else "ma_short",
+        )
 
     def on_tick(self, ctx: StrategyContext, price: float) -> ExitAction | None:
         # This strategy only exits on bar close trend flip; real-time exits reuse shared stop/tp logic handled elsewhere
         return None
+
+    def on_tick_entry(self, ctx: StrategyContext, price: float) -> EntrySignal | None:
+        return None
+
+    def on_tick_exit(self, ctx: StrategyContext, price: float) -> ExitAction | None:
+        return None
@@ -3,8 +3,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
-
 from .registry import get_strategy_defaults
 from ..config import Settings, StrategyEntryConfig
 
@@ -51,7 +49,14 @@ def build_strategy_profile(settings: Settings, entry: StrategyEntryConfig) -> Di
         if not cfg_path.is_absolute():
             cfg_path = (Path.cwd() / cfg_path).resolve()
         if cfg_path.exists():
-            loaded = yaml.safe_load(cfg_path.read_text(encoding="utf-8"))
+            import yaml
+
+            try:
+                from yaml import CSafeLoader as _Loader
+            except ImportError:
+                from yaml import SafeLoader as _Loader
+
+            loaded = yaml.load(cfg_path.read_text(encoding="utf-8"), Loader=_Loader)
             if isinstance(loaded, dict):
                 _deep_update(profile, loaded)
     if isinstance(entry.params, dict) and entry.params:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import copy
+import importlib
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List
 
@@ -18,6 +18,13 @@ _STRATEGY_REGISTRY: Dict[str, StrategyRegistration] = {}
 _BUILTINS_REGISTERED = False
 
 
+def _clone_defaults(src: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Copy a defaults dict; defaults are at most two levels deep ({"rsi": {"length": 14}})."""
+    if not src:
+        return {}
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in src.items()}
+
+
 def register_strategy(
     strategy_type: str,
     factory: Callable[[], IStrategy],
@@ -32,22 +39,29 @@ def register_strategy(
         return
     _STRATEGY_REGISTRY[strategy_type] = StrategyRegistration(
         factory=factory,
-        strategy_defaults=copy.deepcopy(strategy_defaults) if strategy_defaults else {},
-        indicator_defaults=copy.deepcopy(indicator_defaults) if indicator_defaults else {},
+        strategy_defaults=_clone_defaults(strategy_defaults),
+        indicator_defaults=_clone_defaults(indicator_defaults),
     )
 
 
+def _lazy_factory(module: str, cls_name: str) -> Callable[[], IStrategy]:
+    """Factory that imports the strategy module on first instantiation only."""
+
+    def factory() -> IStrategy:
+        cls = getattr(importlib.import_module(module, __package__), cls_name)
+        return cls()
+
+    return factory
+
+
 def _ensure_builtins_registered() -> None:
     global _BUILTINS_REGISTERED
     if _BUILTINS_REGISTERED:
         return
-    from .test_strategy import TestStrategy
-    from .ma_cross_strategy import MaCrossStrategy
-    from .simple_rsi_overtrade_strategy import SimpleRsiOvertradeStrategy
 
     register_strategy(
         "test",
-        TestStrategy,
+        _lazy_factory(".test_strategy", "TestStrategy"),
         strategy_defaults={
             "trend_strength_min": 0.003,
             "atr_stop_mult": 1.5,
@@ -71,7 +85,7 @@ def _ensure_builtins_registered() -> None:
     )
     register_strategy(
         "ma_cross",
-        MaCrossStrategy,
+        _lazy_factory(".ma_cross_strategy", "MaCrossStrategy"),
         strategy_defaults={
             "atr_stop_mult": 1.2,
             "cooldown_after_stop": 2,
@@ -88,7 +102,7 @@ def _ensure_builtins_registered() -> None:
     )
     register_strategy(
         "simple_rsi_overtrade_strategy",
-        SimpleRsiOvertradeStrategy,
+        _lazy_factory(".simple_rsi_overtrade_strategy", "SimpleRsiOvertradeStrategy"),
         strategy_defaults={
             "rsi_low": 30.0,
             "rsi_high": 70.0,
@@ -125,6 +139,6 @@ def create_strategy(strategy_type: str) -> IStrategy:
 def get_strategy_defaults(strategy_type: str) -> Dict[str, Dict[str, Any]]:
     reg = _get_registration(strategy_type)
     return {
-        "strategy": copy.deepcopy(reg.strategy_defaults),
-        "indicators": copy.deepcopy(reg.indicator_defaults),
+        "strategy": _clone_defaults(reg.strategy_defaults),
+        "indicators": _clone_defaults(reg.indicator_defaults),
     }
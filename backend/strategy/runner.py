@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import replace
-from typing import Dict, Optional
+from functools import partial
+from typing import Callable, Dict, Optional
 
 from ..marketdata.buffer import KlineBar
 from ..marketdata.state import MarketStateManager
@@ -10,6 +12,19 @@ from ..services.portfolio_service import PortfolioService
 from ..services.position_service import PositionService
 from .interfaces import EntrySignal, ExitAction, IStrategy, StrategyContext
 
+_IND1H_KEYS = frozenset(("ema20_1h", "ema60_1h", "rsi14_1h", "close_1h"))
+
+
+# fallbacks for strategies that only implement the original on_tick
+def _tick_entry_via_on_tick(strat: IStrategy, ctx: StrategyContext, price: float) -> Optional[EntrySignal]:
+    action = strat.on_tick(ctx, price)
+    return action if isinstance(action, EntrySignal) else None
+
+
+def _tick_exit_via_on_tick(strat: IStrategy, ctx: StrategyContext, price: float) -> Optional[ExitAction]:
+    action = strat.on_tick(ctx, price)
+    return action if isinstance(action, ExitAction) else None
+
 
 class StrategyRunner:
     def __init__(
@@ -28,10 +43,47 @@ class StrategyRunner:
         self._portfolio = portfolio
         self._stream_store = stream_store
         self._last_ctx: Dict[str, StrategyContext] = {}
+        self._tick_ctx: Dict[str, StrategyContext] = {}
+        # (sid, strategy, params) index, built once strategies/specs are in place (see _ensure_index)
+        self._strategy_items: list[tuple[str, IStrategy, dict]] = []
+        self._needs_1h: Dict[str, bool] = {}
+        # profiles are fixed for the lifetime of a run; resolve params once
+        self._params: Dict[str, dict] = {}
+        self._realtime: Dict[str, tuple[bool, bool]] = {}
+        # bound condition_mask per strategy, None when the strategy doesn't define it
+        self._masks: Dict[str, Optional[Callable[[StrategyContext], Optional[tuple]]]] = {}
+        # (tick entry, tick exit) callables per strategy, see _ensure_index
+        self._tick_hooks: Dict[str, tuple[Callable, Callable]] = {}
+        # last pushed condition fingerprint per strategy (tick path only)
+        self._cond_fp: Dict[str, tuple] = {}
         self._logger = logging.getLogger(__name__)
 
+    def _ensure_index(self) -> None:
+        if len(self._strategy_items) == len(self._strategies):
+            return
+        self._needs_1h = {
+            sid: any(getattr(spec, "interval", None) == "1h" for spec in self._state_mgr.indicator_specs.get(sid, []))
+            for sid in self._strategies
+        }
+        self._params = {sid: self._profiles.get(sid, {}).get("strategy", {}) for sid in self._strategies}
+        self._strategy_items = [(sid, strat, self._params[sid]) for sid, strat in self._strategies.items()]
+        self._realtime = {
+            sid: (bool(p.get("realtime_entry", False)), bool(p.get("realtime_exit", False)))
+            for sid, p in self._params.items()
+        }
+        self._masks = {sid: getattr(strat, "condition_mask", None) for sid, strat in self._strategies.items()}
+        self._tick_hooks = {
+            sid: (
+                getattr(strat, "on_tick_entry", None) or partial(_tick_entry_via_on_tick, strat),
+                getattr(strat, "on_tick_exit", None) or partial(_tick_exit_via_on_tick, strat),
+            )
+            for sid, strat in self._strategies.items()
+        }
+
     async def prime_from_history(self, ctx_map: Dict[str, StrategyContext]) -> None:
+        self._ensure_index()
         self._last_ctx = ctx_map or {}
+        self._tick_ctx.clear()
         if not self._last_ctx:
             return
         cond_updates: dict[str, dict] = {}
@@ -39,14 +91,18 @@ class StrategyRunner:
             strat = self._strategies[sid]
             ctx.position = self._position_service.get_position(sid)
             ctx.cooldown_bars_remaining = self._position_service.get_cooldown(sid)
-            ctx.meta["params"] = self._profiles[sid].get("strategy", {})
+            ctx.meta["params"] = self._params[sid]
+            try:
+                strat.on_state_restore(ctx)
+            except Exception:
+                self._logger.exception("on_state_restore failed for %s", sid)
             ind_ready = self._ind_ready(sid, ctx)
             try:
                 conditions = strat.describe_conditions(
                     ctx=ctx,
                     ind_1h_ready=ind_ready,
-                    has_position=self._position_service.get_position(sid) is not None,
-                    cooldown_bars=self._position_service.get_cooldown(sid),
+                    has_position=ctx.position is not None,
+                    cooldown_bars=ctx.cooldown_bars_remaining,
                 )
             except Exception as exc:
                 self._logger.exception("describe_conditions failed (prime) for %s", sid)
@@ -61,6 +117,12 @@ class StrategyRunner:
     def reset_strategy(self, sid: str) -> None:
         if sid in self._last_ctx:
             del self._last_ctx[sid]
+        self._tick_ctx.pop(sid, None)
+        self._cond_fp.pop(sid, None)
+        # optional hook: strategies that carry bar-to-bar state drop it with the account
+        reset_state = getattr(self._strategies.get(sid), "reset_state", None)
+        if reset_state is not None:
+            reset_state()
 
     async def on_kline_update(
         self,
@@ -93,12 +155,11 @@ class StrategyRunner:
                 "v": bar.volume,
                 "x": bar.is_closed,
             }
+        self._ensure_index()
         cond_updates: dict[str, dict] = {}
-        for sid, strat in self._strategies.items():
+        for sid, strat, params in self._strategy_items:
             base_ctx = self._last_ctx.get(sid)
-            needs_1h = any(
-                getattr(spec, "interval", None) == "1h" for spec in self._state_mgr.indicator_specs.get(sid, [])
-            )
+            needs_1h = self._needs_1h[sid]
             if base_ctx is None:
                 indicators = {}
                 preview_res = preview_maps.get(sid) or {}
@@ -124,51 +185,61 @@ class StrategyRunner:
                     cooldown_bars_remaining=0,
                 )
             else:
-                ctx = replace(
-                    base_ctx,
-                    timestamp=bar.close_time,
-                    interval=interval,
-                    price=bar.close,
-                    close_15m=bar.close,
-                    low_15m=bar.low,
-                    high_15m=bar.high,
-                )
+                # one private copy per closed bar, mutated in place on every tick
+                ctx = self._tick_ctx.get(sid)
+                if ctx is None:
+                    ctx = replace(base_ctx, indicators=dict(base_ctx.indicators), indv=None)
+                    self._tick_ctx[sid] = ctx
+                ctx.timestamp = bar.close_time
+                ctx.interval = interval
+                ctx.price = bar.close
+                ctx.close_15m = bar.close
+                ctx.low_15m = bar.low
+                ctx.high_15m = bar.high
             preview_res = preview_maps.get(sid) or {}
             if preview_res:
-                ind_copy = dict(ctx.indicators)
-                ind_copy.update({k: v.value for k, v in preview_res.items()})
-                ind_copy["close_15m"] = bar.close
-                ctx = replace(ctx, indicators=ind_copy)
+                ctx.indicators.update({k: v.value for k, v in preview_res.items()})
+                ctx.indicators["close_15m"] = bar.close
+                ctx.indv = None
             ctx.position = self._position_service.get_position(sid)
             ctx.cooldown_bars_remaining = self._position_service.get_cooldown(sid)
-            ctx.meta["params"] = self._profiles[sid].get("strategy", {})
-            realtime_entry = bool(ctx.meta.get("params", {}).get("realtime_entry", False))
-            realtime_exit = bool(ctx.meta.get("params", {}).get("realtime_exit", False))
+            ctx.meta["params"] = params
+            realtime_entry, realtime_exit = self._realtime[sid]
+            acted = False
             if realtime_entry and ctx.position is None:
                 try:
-                    action = strat.on_tick(ctx, bar.close)
+                    entry = self._tick_hooks[sid][0](ctx, bar.close)
                 except Exception:
-                    self._logger.exception("on_tick failed (update) for %s", sid)
-                    action = None
-                if isinstance(action, EntrySignal):
-                    await self._position_service.open_position(sid, action)
+                    self._logger.exception("on_tick_entry failed (update) for %s", sid)
+                    entry = None
+                if entry is not None:
+                    await self._position_service.open_position(sid, entry)
+                    acted = True
             elif realtime_exit and ctx.position is not None:
                 try:
-                    action = strat.on_tick(ctx, bar.close)
+                    exit_action = self._tick_hooks[sid][1](ctx, bar.close)
                 except Exception:
-                    self._logger.exception("on_tick failed (update) for %s", sid)
-                    action = None
-                if isinstance(action, ExitAction):
-                    await self._position_service.close_by_action(sid, action)
-            ctx.position = self._position_service.get_position(sid)
-            ctx.cooldown_bars_remaining = self._position_service.get_cooldown(sid)
+                    self._logger.exception("on_tick_exit failed (update) for %s", sid)
+                    exit_action = None
+                if exit_action is not None:
+                    await self._position_service.close_by_action(sid, exit_action)
+                    acted = True
+            if acted:
+                ctx.position = self._position_service.get_position(sid)
+                ctx.cooldown_bars_remaining = self._position_service.get_cooldown(sid)
             ind_ready = self._ind_ready(sid, ctx)
+            mask_fn = self._masks[sid]
+            mask = mask_fn(ctx) if mask_fn is not None else None
+            fp = (ind_ready, ctx.position is not None, ctx.cooldown_bars_remaining, mask)
+            if mask is not None and self._cond_fp.get(sid) == fp:
+                # snapshot already holds these conditions; skip rebuild and push
+                continue
             try:
                 conditions = strat.describe_conditions(
                     ctx=ctx,
                     ind_1h_ready=ind_ready,
-                    has_position=self._position_service.get_position(sid) is not None,
-                    cooldown_bars=self._position_service.get_cooldown(sid),
+                    has_position=ctx.position is not None,
+                    cooldown_bars=ctx.cooldown_bars_remaining,
                 )
             except Exception as exc:
                 self._logger.exception("describe_conditions failed (update) for %s", sid)
@@ -176,12 +247,18 @@ class StrategyRunner:
                     "long": [{"label": "条件计算异常", "ok": False, "desc": str(exc)}],
                     "short": [{"label": "条件计算异常", "ok": False, "desc": str(exc)}],
                 }
+                fp = None
+            self._remember_fp(sid, fp)
             cond_updates[sid] = conditions
         if cond_updates:
             payload["conditions"] = cond_updates
         if payload:
-            await self._stream_store.update_snapshot(**payload)
-        await self._portfolio.update_status(bar.close)
+            await asyncio.gather(
+                self._stream_store.update_snapshot(**payload),
+                self._portfolio.update_status(bar.close),
+            )
+        else:
+            await self._portfolio.update_status(bar.close)
 
     async def on_kline_close(self, interval: str, bar: KlineBar, res: dict) -> None:
         self._portfolio.set_last_price(bar.close)
@@ -190,24 +267,26 @@ class StrategyRunner:
         stream_updates = res.get("stream") or {}
         strat_res = res.get("strategies") or {}
 
-        if stream_updates:
-            await self._stream_store.update_snapshot(**stream_updates)
-
+        # indicators + all strategies' conditions go out in a single snapshot update
+        payload = dict(stream_updates)
+        cond_map: dict[str, dict] = {}
+        self._ensure_index()
         for sid, data in strat_res.items():
             strat = self._strategies[sid]
             ctx: StrategyContext = data["ctx"]
             ctx.position = self._position_service.get_position(sid)
             ctx.cooldown_bars_remaining = self._position_service.get_cooldown(sid)
-            ctx.meta["params"] = self._profiles[sid].get("strategy", {})
+            ctx.meta["params"] = self._params[sid]
             self._last_ctx[sid] = ctx
+            self._tick_ctx.pop(sid, None)
 
             ind_ready = self._ind_ready(sid, ctx)
             try:
                 conditions = strat.describe_conditions(
                     ctx=ctx,
                     ind_1h_ready=ind_ready,
-                    has_position=self._position_service.get_position(sid) is not None,
-                    cooldown_bars=self._position_service.get_cooldown(sid),
+                    has_position=ctx.position is not None,
+                    cooldown_bars=ctx.cooldown_bars_remaining,
                 )
             except Exception as exc:
                 self._logger.exception("describe_conditions failed for %s", sid)
@@ -216,9 +295,12 @@ class StrategyRunner:
                     "long": [{"label": "条件计算异常", "ok": False, "info": msg}],
                     "short": [{"label": "条件计算异常", "ok": False, "info": msg}],
                 }
-            await self._stream_store.update_snapshot(conditions={sid: conditions})
+            # bar close always rebuilds; drop the tick-path cache so the next update re-describes
+            self._remember_fp(sid, None)
+            cond_map[sid] = conditions
 
             signal = strat.on_bar_close(ctx)
+            # actions stay sequential: position writes share one DB connection
             if isinstance(signal, EntrySignal):
                 await self._position_service.open_position(sid, signal)
             elif isinstance(signal, ExitAction):
@@ -226,15 +308,26 @@ class StrategyRunner:
 
             self._position_service.decrement_cooldown(sid)
 
-        await self._portfolio.update_status(bar.close)
+        if cond_map:
+            payload["conditions"] = cond_map
+        if payload:
+            await asyncio.gather(
+                self._stream_store.update_snapshot(**payload),
+                self._portfolio.update_status(bar.close),
+            )
+        else:
+            await self._portfolio.update_status(bar.close)
         await self._portfolio.snapshot_equity()
 
+    def _remember_fp(self, sid: str, fp: Optional[tuple]) -> None:
+        if fp is None or fp[-1] is None:
+            self._cond_fp.pop(sid, None)
+        else:
+            self._cond_fp[sid] = fp
+
     def _ind_ready(self, sid: str, ctx: StrategyContext) -> bool:
-        needs_1h = any(
-            getattr(spec, "interval", None) == "1h" for spec in self._state_mgr.indicator_specs.get(sid, [])
-        )
-        if not needs_1h:
+        if not self._needs_1h.get(sid, True):
             return True
-        return self._state_mgr.ind_1h_map.get(sid) is not None or all(
-            k in (ctx.indicators or {}) for k in ("ema20_1h", "ema60_1h", "rsi14_1h", "close_1h")
+        return sid in self._state_mgr.ind_1h_map or (
+            ctx.indicators is not None and _IND1H_KEYS <= ctx.indicators.keys()
         )
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+from ..indicators import RsiSpec
 from .interfaces import EntrySignal, ExitAction, IStrategy, StrategyContext
 
 
+def _read_thresholds(params: dict) -> tuple:
+    return (
+        params.get("rsi_low", 30.0),
+        params.get("rsi_high", 70.0),
+        params.get("stop_loss_pct", 0.01),
+        params.get("rr", 1.5),
+    )
+
+
 class SimpleRsiOvertradeStrategy(IStrategy):
     """RSI mean-reversion: RSI<low -> long, RSI>high -> short, RR-based TP/SL."""
 
@@ -10,18 +20,34 @@ class SimpleRsiOvertradeStrategy(IStrategy):
 
     def __init__(self) -> None:
         self._profile = {}
+        # (rsi_low, rsi_high, stop_loss_pct, rr) bound in configure(); None -> read ctx.meta params
+        self._thresholds: tuple | None = None
+        self._ind_reqs = self._build_ind_reqs()
+        self._warmup = self._build_warmup_policy()
 
     def configure(self, profile: dict) -> None:
         self._profile = profile or {}
+        self._ind_reqs = self._build_ind_reqs()
+        self._warmup = self._build_warmup_policy()
+        self._thresholds = _read_thresholds(self._profile.get("strategy") or {})
+
+    def _params(self, ctx: StrategyContext) -> tuple:
+        if self._thresholds is not None:
+            return self._thresholds
+        return _read_thresholds(ctx.meta.get("params", {}) or {})
 
     def indicator_requirements(self) -> dict:
-        from ..indicators import RsiSpec
+        return self._ind_reqs
+
+    def warmup_policy(self) -> dict:
+        return self._warmup
 
+    def _build_ind_reqs(self) -> list:
         ind = (self._profile.get("indicators") or {})
         rsi_len = ind.get("rsi", {}).get("length", 14)
         return [RsiSpec(name="rsi14_15m", interval="15m", length=rsi_len)]
 
-    def warmup_policy(self) -> dict:
+    def _build_warmup_policy(self) -> dict:
         kc = (self._profile.get("kline_cache") or {})
         return {
             "15m": {"buffer_mult": kc.get("warmup_buffer_mult", 3.0), "extra": kc.get("warmup_extra_bars", 200)},
@@ -37,10 +63,9 @@ class SimpleRsiOvertradeStrategy(IStrategy):
             label = f"冷却中({cooldown_bars})"
             return {"long": [item("LONG", False, label)], "short": [item("SHORT", False, label)]}
 
-        params = ctx.meta.get("params", {}) or {}
-        rsi_low = params.get("rsi_low", 30.0)
-        rsi_high = params.get("rsi_high", 70.0)
-        rsi = ctx.ind("rsi14_15m")
+        rsi_low, rsi_high, _, _ = self._params(ctx)
+        iv = ctx.view()
+        rsi = iv.rsi14_15m
         if rsi is None:
             return {
                 "long": [item("LONG", False, "RSI未就绪")],
@@ -66,13 +91,16 @@ class SimpleRsiOvertradeStrategy(IStrategy):
             return None
         return self._check_exit(ctx, price)
 
+    def on_tick_entry(self, ctx: StrategyContext, price: float) -> EntrySignal | None:
+        return None
+
+    def on_tick_exit(self, ctx: StrategyContext, price: float) -> ExitAction | None:
+        return self._check_exit(ctx, price)
+
     def _check_entry(self, ctx: StrategyContext, price: float) -> EntrySignal | None:
-        params = ctx.meta.get("params", {}) or {}
-        rsi_low = params.get("rsi_low", 30.0)
-        rsi_high = params.get("rsi_high", 70.0)
-        stop_loss_pct = params.get("stop_loss_pct", 0.01)
-        rr = params.get("rr", 1.5)
-        rsi = ctx.ind("rsi14_15m")
+        rsi_low, rsi_high, stop_loss_pct, rr = self._params(ctx)
+        iv = ctx.view()
+        rsi = iv.rsi14_15m
         if rsi is None:
             return None
 
@@ -105,7 +133,7 @@ class SimpleRsiOvertradeStrategy(IStrategy):
         pos = ctx.position
         if pos is None:
             return None
-        if pos.side == "LONG":
+        if pos.is_long:
             if price <= pos.stop_price:
                 return ExitAction(action="STOP", price=pos.stop_price, reason="stop")
             if price >= pos.tp2_price:
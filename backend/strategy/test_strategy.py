@@ -1,6 +1,22 @@
 from __future__ import annotations
 
-from .interfaces import EntrySignal, ExitAction, IStrategy, StrategyContext
+import math
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from ..indicators import AtrSpec, EmaSpec, MacdSpec, RsiSpec
+from .interfaces import EntrySignal, ExitAction, IStrategy, PositionState, StrategyContext
+
+__all__ = [
+    "SIDE_LONG",
+    "SIDE_SHORT",
+    "StrategyParams",
+    "TestStrategy",
+]
+
+# side codes used by the float kernels; EntrySignal.side keeps "LONG"/"SHORT"
+SIDE_LONG = 1
+SIDE_SHORT = -1
 
 
 def _macd_hist_increasing(prev2: float, prev1: float, curr: float) -> bool:
@@ -11,72 +27,328 @@ def _macd_hist_decreasing(prev2: float, prev1: float, curr: float) -> bool:
     return prev2 > prev1 > curr
 
 
-def _choose_stop_long(entry: float, atr: float, structure_stop: float | None, atr_mult: float) -> float:
-    atr_stop = entry - atr_mult * atr
-    if structure_stop is None:
-        return atr_stop
-    return min(structure_stop, atr_stop)
+# a missing structure stop arrives as +inf (long) / -inf (short), so min/max fall through to the ATR stop
+def _choose_stop_long(entry: float, atr: float, structure_stop: float, atr_mult: float) -> float:
+    return min(structure_stop, entry - atr_mult * atr)
 
 
-def _choose_stop_short(entry: float, atr: float, structure_stop: float | None, atr_mult: float) -> float:
-    atr_stop = entry + atr_mult * atr
-    if structure_stop is None:
-        return atr_stop
-    return max(structure_stop, atr_stop)
+def _choose_stop_short(entry: float, atr: float, structure_stop: float, atr_mult: float) -> float:
+    return max(structure_stop, entry + atr_mult * atr)
 
 
 def _calc_targets(entry: float, stop: float) -> tuple[float, float]:
-    r = abs(entry - stop)
-    tp1 = entry + r if entry > stop else entry - r
-    tp2 = entry + 2 * r if entry > stop else entry - 2 * r
-    return tp1, tp2
+    # entry - stop carries the side: positive for LONG, negative for SHORT
+    d = entry - stop
+    return entry + d, entry + 2.0 * d
+
 
+def _f(v: float | None) -> float:
+    return math.nan if v is None else v
 
-def _fmt(v: float | None, nd: int = 2) -> str:
-    return f"{v:.{nd}f}" if v is not None else "n/a"
 
+def _z(v: float) -> float:
+    # missing (NaN) -> 0.0, the original `x or 0` reading of absent 1h trend inputs
+    return 0.0 if v != v else v
 
-def _trend_direction_ok(close: float | None, ema20: float | None, ema60: float | None, rsi: float | None, side: str) -> bool:
-    close_v = close or 0
-    ema20_v = ema20 or 0
-    ema60_v = ema60 or 0
-    rsi_v = rsi or 0
-    if side == "LONG":
-        return close_v > ema60_v and ema20_v > ema60_v and rsi_v > 50
-    return close_v < ema60_v and ema20_v < ema60_v and rsi_v < 50
 
+def _prev_inputs(ctx: StrategyContext) -> tuple[float, float, float]:
+    """(rsi prev1, macd_hist prev1, macd_hist prev2) with one history lookup per series."""
+    hist = ctx.history
+    rsi_seq = hist.get("rsi14_15m")
+    rsi_prev = rsi_seq[-1] if isinstance(rsi_seq, (list, tuple)) and rsi_seq else None
+    macd_seq = hist.get("macd_hist_15m")
+    if isinstance(macd_seq, (list, tuple)):
+        n = len(macd_seq)
+        macd_prev1 = macd_seq[-1] if n >= 1 else None
+        macd_prev2 = macd_seq[-2] if n >= 2 else None
+    else:
+        macd_prev1 = macd_prev2 = None
+    return _f(rsi_prev), _f(macd_prev1), _f(macd_prev2)
 
-def _trend_strength(ema20: float | None, ema60: float | None, close: float | None) -> float:
-    return abs((ema20 or 0) - (ema60 or 0)) / (close or 1)
 
+def _fmt(v: float, nd: int = 2) -> str:
+    return "n/a" if math.isnan(v) else f"{v:.{nd}f}"
 
-def _price_ok(ctx: StrategyContext, ema20: float | None, ema60: float | None, side: str) -> bool:
-    if side == "LONG":
-        return ctx.low_15m <= (ema20 or ctx.low_15m) and ctx.close_15m > (ema60 or ctx.close_15m)
-    return ctx.high_15m >= (ema20 or ctx.high_15m) and ctx.close_15m < (ema60 or ctx.close_15m)
 
+# Indicator inputs below are floats with NaN for "missing": NaN fails every comparison,
+# so stale/unready values gate the condition off without per-value None checks.
+# The 1h trend inputs are the exception: missing values read as 0.0 (see _z), as they
+# always have, so e.g. a missing rsi14_1h still counts as "< 50" for shorts.
+# long/short variants combine the comparisons with '&' (no short-circuit jumps, no side string)
+def _trend_dir_long(close: float, ema20: float, ema60: float, rsi: float) -> bool:
+    return (close > ema60) & (ema20 > ema60) & (rsi > 50.0)
 
-def _macd_ok(curr: float | None, prev1: float | None, prev2: float | None, side: str) -> bool:
-    if curr is None or prev1 is None or prev2 is None:
-        return False
-    if side == "LONG":
+
+def _trend_dir_short(close: float, ema20: float, ema60: float, rsi: float) -> bool:
+    return (close < ema60) & (ema20 < ema60) & (rsi < 50.0)
+
+
+def _trend_strength(ema20: float, ema60: float, close: float) -> float:
+    return math.fabs(ema20 - ema60) / (close or 1.0)
+
+
+def _price_ok_long(close: float, low: float, ema20: float, ema60: float) -> bool:
+    # a missing ema20 (NaN != NaN) does not block the pullback check
+    return ((low <= ema20) | (ema20 != ema20)) & (close > ema60)
+
+
+def _price_ok_short(close: float, high: float, ema20: float, ema60: float) -> bool:
+    return ((high >= ema20) | (ema20 != ema20)) & (close < ema60)
+
+
+def _macd_ok(curr: float, prev1: float, prev2: float, side: int) -> bool:
+    if side > 0:
         return _macd_hist_increasing(prev2, prev1, curr)
     return _macd_hist_decreasing(prev2, prev1, curr)
 
 
 def _rsi_ok(
-    curr: float | None,
-    prev: float | None,
-    side: str,
-    lower: float,
-    upper: float,
+    curr: float,
+    prev: float,
+    side: int,
+    in_band: bool,
     slope_required: bool,
 ) -> bool:
-    if curr is None or not (lower <= curr <= upper):
+    if not in_band:
         return False
-    if not slope_required or prev is None:
+    if not slope_required or math.isnan(prev):
         return True
-    return curr > prev if side == "LONG" else curr < prev
+    return curr > prev if side > 0 else curr < prev
+
+
+def _trend_filter_long(close: float, ema20: float, ema60: float, rsi: float, strength_min: float) -> bool:
+    if not _trend_dir_long(close, ema20, ema60, rsi):
+        return False
+    # the direction check makes the gap >= 0, so a non-positive threshold needs no divide
+    return strength_min <= 0.0 or (ema20 - ema60) / (close or 1.0) >= strength_min
+
+
+def _trend_filter_short(close: float, ema20: float, ema60: float, rsi: float, strength_min: float) -> bool:
+    if not _trend_dir_short(close, ema20, ema60, rsi):
+        return False
+    return strength_min <= 0.0 or (ema60 - ema20) / (close or 1.0) >= strength_min
+
+
+_NO_ENTRY = (False, math.nan, math.nan, math.nan, math.nan)
+
+
+# Float-only entry kernels (NaN = missing, as above).
+def _eval_long_entry(
+    close: float,
+    low: float,
+    high: float,
+    ema20: float,
+    ema60: float,
+    rsi_curr: float,
+    rsi_prev: float,
+    macd_c: float,
+    macd_p1: float,
+    macd_p2: float,
+    atr: float,
+    structure_stop: float,
+    rsi_band_ok: bool,
+    rsi_slope_req: bool,
+    atr_mult: float,
+) -> tuple[bool, float, float, float, float]:
+    if not rsi_band_ok:
+        return _NO_ENTRY
+    if rsi_slope_req and not math.isnan(rsi_prev) and not rsi_curr > rsi_prev:
+        return _NO_ENTRY
+    if not _price_ok_long(close, low, ema20, ema60):
+        return _NO_ENTRY
+    if not macd_p2 < macd_p1 < macd_c:
+        return _NO_ENTRY
+    if atr != atr:
+        # no ATR -> no stop distance -> no entry
+        return _NO_ENTRY
+    stop = _choose_stop_long(close, atr, structure_stop, atr_mult)
+    if not math.isfinite(stop):
+        # an infinite ATR or structure level must not reach the position service
+        return _NO_ENTRY
+    tp1, tp2 = _calc_targets(close, stop)
+    return True, close, stop, tp1, tp2
+
+
+def _eval_short_entry(
+    close: float,
+    low: float,
+    high: float,
+    ema20: float,
+    ema60: float,
+    rsi_curr: float,
+    rsi_prev: float,
+    macd_c: float,
+    macd_p1: float,
+    macd_p2: float,
+    atr: float,
+    structure_stop: float,
+    rsi_band_ok: bool,
+    rsi_slope_req: bool,
+    atr_mult: float,
+) -> tuple[bool, float, float, float, float]:
+    if not rsi_band_ok:
+        return _NO_ENTRY
+    if rsi_slope_req and not math.isnan(rsi_prev) and not rsi_curr < rsi_prev:
+        return _NO_ENTRY
+    if not _price_ok_short(close, high, ema20, ema60):
+        return _NO_ENTRY
+    if not macd_p2 > macd_p1 > macd_c:
+        return _NO_ENTRY
+    if atr != atr:
+        # no ATR -> no stop distance -> no entry
+        return _NO_ENTRY
+    stop = _choose_stop_short(close, atr, structure_stop, atr_mult)
+    if not math.isfinite(stop):
+        # an infinite ATR or structure level must not reach the position service
+        return _NO_ENTRY
+    tp1, tp2 = _calc_targets(close, stop)
+    return True, close, stop, tp1, tp2
+
+
+def _eval_bar(
+    close: float,
+    low: float,
+    high: float,
+    ema20: float,
+    ema60: float,
+    rsi_curr: float,
+    rsi_prev: float,
+    macd_c: float,
+    macd_p1: float,
+    macd_p2: float,
+    atr: float,
+    structure_stop: float,
+    ind1_close: float,
+    ind1_ema20: float,
+    ind1_ema60: float,
+    ind1_rsi: float,
+    params: tuple,
+) -> tuple[int, float, float, float, float]:
+    """
+    Whole bar-close entry decision on floats: (side_code, entry, stop, tp1, tp2) with
+    side_code SIDE_LONG, SIDE_SHORT or 0 = none. ``params`` is StrategyParams.kernel.
+    The ind1_* (1h) inputs use 0.0 for missing values, see _z.
+    A NaN structure_stop means none and is swapped for the side's neutral infinity.
+    """
+    tsm, l_lo, l_hi, s_lo, s_hi, atr_mult, slope_req = params
+    has_structure = structure_stop == structure_stop
+    # the 1h filter admits at most one side, so only that side's kernel runs
+    if _trend_filter_long(ind1_close, ind1_ema20, ind1_ema60, ind1_rsi, tsm):
+        fire, entry, stop, tp1, tp2 = _eval_long_entry(
+            close, low, high, ema20, ema60, rsi_curr, rsi_prev, macd_c, macd_p1, macd_p2, atr,
+            structure_stop if has_structure else math.inf, l_lo <= rsi_curr <= l_hi, slope_req, atr_mult,
+        )
+        if fire:
+            return SIDE_LONG, entry, stop, tp1, tp2
+    elif _trend_filter_short(ind1_close, ind1_ema20, ind1_ema60, ind1_rsi, tsm):
+        fire, entry, stop, tp1, tp2 = _eval_short_entry(
+            close, low, high, ema20, ema60, rsi_curr, rsi_prev, macd_c, macd_p1, macd_p2, atr,
+            structure_stop if has_structure else -math.inf, s_lo <= rsi_curr <= s_hi, slope_req, atr_mult,
+        )
+        if fire:
+            return SIDE_SHORT, entry, stop, tp1, tp2
+    return 0, math.nan, math.nan, math.nan, math.nan
+
+
+def _entry_from_code(side_code: int, entry: float, stop: float, tp1: float, tp2: float) -> EntrySignal:
+    if side_code > 0:
+        return EntrySignal(side="LONG", entry_price=entry, stop_price=stop, tp1_price=tp1, tp2_price=tp2, reason="signal_long")
+    return EntrySignal(side="SHORT", entry_price=entry, stop_price=stop, tp1_price=tp1, tp2_price=tp2, reason="signal_short")
+
+
+# condition descriptions; bound .format of module-level templates
+_DESC_1H_DIR = "1h方向 close={} ema20={} ema60={} rsi={}".format
+_DESC_PRICE_LONG = "价位 low<=ema20({}) & close>{}".format
+_DESC_PRICE_SHORT = "价位 high>=ema20({}) & close<{}".format
+_DESC_RSI = "RSI {} in [{},{}] Δ={}".format
+_DESC_MACD_UP = "MACD柱上升 p2={} p1={} now={}".format
+_DESC_MACD_DOWN = "MACD柱下降 p2={} p1={} now={}".format
+_TARGET_MIN = ">={:.4f}".format
+
+
+def _rsi_delta(curr: float, prev: float) -> float | None:
+    delta = curr - prev
+    return None if math.isnan(delta) else delta
+
+
+def _cond_pair(
+    tf: str,
+    ok_long: bool,
+    ok_short: bool,
+    desc_long: str,
+    desc_short: str | None = None,
+    value=None,
+    target=None,
+) -> tuple[dict, dict]:
+    label_long = f"[{tf}]{desc_long}"
+    if desc_short is None:
+        desc_short, label_short = desc_long, label_long
+    else:
+        label_short = f"[{tf}]{desc_short}"
+    long_item = {"direction": "LONG", "timeframe": tf, "ok": bool(ok_long), "desc": desc_long, "label": label_long}
+    short_item = {"direction": "SHORT", "timeframe": tf, "ok": bool(ok_short), "desc": desc_short, "label": label_short}
+    if value is not None:
+        long_item["value"] = short_item["value"] = value
+    if target is not None:
+        long_item["target"] = short_item["target"] = target
+    return long_item, short_item
+
+
+def _blocked(desc: str, tf: str) -> dict:
+    long_item, short_item = _cond_pair(tf, False, False, desc)
+    return {"long": [long_item], "short": [short_item]}
+
+
+# shared read-only defaults for absent profile sections
+_EMPTY = MappingProxyType({})
+_DEFAULT_MACD = MappingProxyType({"fast": 12, "slow": 26, "signal": 9})
+
+
+@dataclass(slots=True, frozen=True)
+class StrategyParams:
+    trend_strength_min: float = 0.0
+    rsi_long_lower: float = 50.0
+    rsi_long_upper: float = 60.0
+    rsi_short_lower: float = 40.0
+    rsi_short_upper: float = 50.0
+    rsi_slope_required: bool = False
+    atr_stop_mult: float = 1.5
+    # flat float tuple handed to _eval_bar
+    kernel: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "kernel",
+            (
+                self.trend_strength_min,
+                self.rsi_long_lower,
+                self.rsi_long_upper,
+                self.rsi_short_lower,
+                self.rsi_short_upper,
+                self.atr_stop_mult,
+                self.rsi_slope_required,
+            ),
+        )
+
+    @classmethod
+    def from_params(cls, params: dict) -> "StrategyParams":
+        return cls(
+            trend_strength_min=params.get("trend_strength_min", 0.0),
+            rsi_long_lower=params.get("rsi_long_lower", 50.0),
+            rsi_long_upper=params.get("rsi_long_upper", 60.0),
+            rsi_short_lower=params.get("rsi_short_lower", 40.0),
+            rsi_short_upper=params.get("rsi_short_upper", 50.0),
+            rsi_slope_required=params.get("rsi_slope_required", False),
+            atr_stop_mult=params.get("atr_stop_mult", 1.5),
+        )
+
+    def rsi_bands(self, rsi: float) -> tuple[bool, bool]:
+        """(long, short) RSI band checks, evaluated once per bar and shared by both sides."""
+        return (
+            self.rsi_long_lower <= rsi <= self.rsi_long_upper,
+            self.rsi_short_lower <= rsi <= self.rsi_short_upper,
+        )
 
 
 class TestStrategy(IStrategy):
@@ -86,24 +358,39 @@ class TestStrategy(IStrategy):
 
     def __init__(self) -> None:
         self._profile = {}
+        # bound in configure(); None -> read ctx.meta params
+        self._strategy_params: StrategyParams | None = None
+        # (inputs, result) of the last full describe_conditions evaluation
+        self._describe_cache: tuple | None = None
+        self._ind_reqs = self._build_ind_reqs()
+        self._warmup = self._build_warmup_policy()
 
     def configure(self, profile: dict) -> None:
-        self._profile = profile or {}
-
-    def indicator_requirements(self) -> dict:
-        from ..indicators import EmaSpec, RsiSpec, MacdSpec, AtrSpec
-
-        ind = (self._profile.get("indicators") or {})
-        ema_fast = ind.get("ema_fast", {}).get("length", 20)
-        ema_slow = ind.get("ema_slow", {}).get("length", 60)
-        ema_trend = ind.get("ema_trend", {})
+        self._profile = profile or _EMPTY
+        self._strategy_params = StrategyParams.from_params(self._profile.get("strategy") or _EMPTY)
+        self._ind_reqs = self._build_ind_reqs()
+        self._warmup = self._build_warmup_policy()
+
+    def _params(self, ctx: StrategyContext) -> StrategyParams:
+        if self._strategy_params is not None:
+            return self._strategy_params
+        return StrategyParams.from_params(ctx.meta.get("params") or _EMPTY)
+
+    def indicator_requirements(self) -> tuple:
+        return self._ind_reqs
+
+    def _build_ind_reqs(self) -> tuple:
+        ind = self._profile.get("indicators") or _EMPTY
+        ema_fast = (ind.get("ema_fast") or _EMPTY).get("length", 20)
+        ema_slow = (ind.get("ema_slow") or _EMPTY).get("length", 60)
+        ema_trend = ind.get("ema_trend") or _EMPTY
         trend_fast = ema_trend.get("fast", 20)
         trend_slow = ema_trend.get("slow", 60)
-        rsi_len = ind.get("rsi", {}).get("length", 14)
-        macd_cfg = ind.get("macd", {"fast": 12, "slow": 26, "signal": 9})
-        atr_len = ind.get("atr", {}).get("length", 14)
+        rsi_len = (ind.get("rsi") or _EMPTY).get("length", 14)
+        macd_cfg = ind.get("macd") or _DEFAULT_MACD
+        atr_len = (ind.get("atr") or _EMPTY).get("length", 14)
 
-        return [
+        return (
             EmaSpec(name="ema20_15m", interval="15m", length=ema_fast),
             EmaSpec(name="ema60_15m", interval="15m", length=ema_slow),
             RsiSpec(name="rsi14_15m", interval="15m", length=rsi_len),
@@ -118,203 +405,183 @@ class TestStrategy(IStrategy):
             EmaSpec(name="ema20_1h", interval="1h", length=trend_fast),
             EmaSpec(name="ema60_1h", interval="1h", length=trend_slow),
             RsiSpec(name="rsi14_1h", interval="1h", length=rsi_len),
-        ]
+        )
 
     def warmup_policy(self) -> dict:
-        kc = (self._profile.get("kline_cache") or {})
+        return self._warmup
+
+    def _build_warmup_policy(self) -> dict:
+        kc = self._profile.get("kline_cache") or _EMPTY
         return {
             "15m": {"buffer_mult": kc.get("warmup_buffer_mult", 3.0), "extra": kc.get("warmup_extra_bars", 200)},
             "1h": {"buffer_mult": kc.get("warmup_buffer_mult", 3.0), "extra": kc.get("warmup_extra_bars", 200)},
         }
 
     def describe_conditions(self, ctx: StrategyContext, ind_1h_ready: bool, has_position: bool, cooldown_bars: int) -> dict:
-        def item(direction: str, tf: str, ok: bool, desc: str, value=None, target=None):
-            d = {"direction": direction, "timeframe": tf, "ok": bool(ok), "desc": desc, "label": f"[{tf}]{desc}"}
-            if value is not None:
-                d["value"] = value
-            if target is not None:
-                d["target"] = target
-            return d
-
-        def blocked(desc: str, tf: str) -> dict:
-            return {
-                "long": [item("LONG", tf, False, desc)],
-                "short": [item("SHORT", tf, False, desc)],
-            }
-
         if not ind_1h_ready:
-            return blocked("1h指标未就绪", "1h")
+            return _blocked("1h指标未就绪", "1h")
         if has_position:
-            return blocked("已有持仓", "15m")
+            return _blocked("已有持仓", "15m")
         if cooldown_bars > 0:
-            return blocked(f"冷却中({cooldown_bars})", "15m")
-
-        params = ctx.meta.get("params", {}) or {}
-        trend_strength_min = params.get("trend_strength_min", 0.0)
-        rsi_long_lower = params.get("rsi_long_lower", 50.0)
-        rsi_long_upper = params.get("rsi_long_upper", 60.0)
-        rsi_short_upper = params.get("rsi_short_upper", 50.0)
-        rsi_short_lower = params.get("rsi_short_lower", 40.0)
-        rsi_slope_required = params.get("rsi_slope_required", False)
-
-        cond_long: list[dict] = []
-        cond_short: list[dict] = []
-
-        close_1h = ctx.ind("close_1h")
-        ema20_1h = ctx.ind("ema20_1h")
-        ema60_1h = ctx.ind("ema60_1h")
-        rsi1h = ctx.ind("rsi14_1h")
-
-        long_dir = _trend_direction_ok(close_1h, ema20_1h, ema60_1h, rsi1h, "LONG")
-        short_dir = _trend_direction_ok(close_1h, ema20_1h, ema60_1h, rsi1h, "SHORT")
-        cond_long.append(
-            item(
-                "LONG",
-                "1h",
-                long_dir,
-                f"1h方向 close={_fmt(close_1h)} ema20={_fmt(ema20_1h)} ema60={_fmt(ema60_1h)} rsi={_fmt(rsi1h,1)}",
-            )
+            return _blocked(f"冷却中({cooldown_bars})", "15m")
+
+        p = self._params(ctx)
+        iv = ctx.view()
+        close_1h = _f(iv.close_1h)
+        ema20_1h = _f(iv.ema20_1h)
+        ema60_1h = _f(iv.ema60_1h)
+        rsi1h = _f(iv.rsi14_1h)
+        ema20_15m = _f(iv.ema20_15m)
+        ema60_15m = _f(iv.ema60_15m)
+        rsi_curr = _f(iv.rsi14_15m)
+        macd_curr = _f(iv.macd_hist_15m)
+        rsi_prev, macd_prev1, macd_prev2 = _prev_inputs(ctx)
+
+        key = (
+            p,
+            ctx.close_15m,
+            ctx.low_15m,
+            ctx.high_15m,
+            close_1h,
+            ema20_1h,
+            ema60_1h,
+            rsi1h,
+            ema20_15m,
+            ema60_15m,
+            rsi_curr,
+            rsi_prev,
+            macd_curr,
+            macd_prev1,
+            macd_prev2,
         )
-        cond_short.append(
-            item(
-                "SHORT",
-                "1h",
-                short_dir,
-                f"1h方向 close={_fmt(close_1h)} ema20={_fmt(ema20_1h)} ema60={_fmt(ema60_1h)} rsi={_fmt(rsi1h,1)}",
-            )
+        cached = self._describe_cache
+        if cached is not None and cached[0] == key:
+            # result is shared between calls; consumers (stream/API) only read it
+            return cached[1]
+
+        # each predicate/description is computed once and emitted as a long/short pair
+        trend_1h = (_z(close_1h), _z(ema20_1h), _z(ema60_1h), _z(rsi1h))
+        dir_1h = _cond_pair(
+            "1h",
+            _trend_dir_long(*trend_1h),
+            _trend_dir_short(*trend_1h),
+            _DESC_1H_DIR(_fmt(close_1h), _fmt(ema20_1h), _fmt(ema60_1h), _fmt(rsi1h, 1)),
         )
 
-        strength = _trend_strength(ema20_1h, ema60_1h, close_1h)
-        strength_ok = strength >= trend_strength_min
-        cond_long.append(item("LONG", "1h", strength_ok, "趋势强度", value=strength, target=f">={trend_strength_min:.4f}"))
-        cond_short.append(item("SHORT", "1h", strength_ok, "趋势强度", value=strength, target=f">={trend_strength_min:.4f}"))
-
-        ema20_15m = ctx.ind("ema20_15m")
-        ema60_15m = ctx.ind("ema60_15m")
-        price_long = _price_ok(ctx, ema20_15m, ema60_15m, "LONG")
-        price_short = _price_ok(ctx, ema20_15m, ema60_15m, "SHORT")
-        cond_long.append(
-            item(
-                "LONG",
-                "15m",
-                price_long,
-                f"价位 low<=ema20({_fmt(ema20_15m)}) & close>{_fmt(ema60_15m)}",
-            )
-        )
-        cond_short.append(
-            item(
-                "SHORT",
-                "15m",
-                price_short,
-                f"价位 high>=ema20({_fmt(ema20_15m)}) & close<{_fmt(ema60_15m)}",
-            )
+        strength = _trend_strength(trend_1h[1], trend_1h[2], trend_1h[0])
+        strength_ok = strength >= p.trend_strength_min
+        strength_1h = _cond_pair(
+            "1h",
+            strength_ok,
+            strength_ok,
+            "趋势强度",
+            value=strength,
+            target=_TARGET_MIN(p.trend_strength_min),
         )
 
-        rsi_curr = ctx.ind("rsi14_15m")
-        rsi_prev = ctx.prev("rsi14_15m", 1, None)
-        rsi_delta = (rsi_curr - rsi_prev) if (rsi_curr is not None and rsi_prev is not None) else None
-        rsi_long_ok = _rsi_ok(rsi_curr, rsi_prev, "LONG", rsi_long_lower, rsi_long_upper, rsi_slope_required)
-        rsi_short_ok = _rsi_ok(rsi_curr, rsi_prev, "SHORT", rsi_short_lower, rsi_short_upper, rsi_slope_required)
-        rsi_desc_long = f"RSI {_fmt(rsi_curr,2)} in [{rsi_long_lower},{rsi_long_upper}] Δ={rsi_delta}"
-        rsi_desc_short = f"RSI {_fmt(rsi_curr,2)} in [{rsi_short_lower},{rsi_short_upper}] Δ={rsi_delta}"
-        cond_long.append(item("LONG", "15m", rsi_long_ok, rsi_desc_long))
-        cond_short.append(item("SHORT", "15m", rsi_short_ok, rsi_desc_short))
-
-        macd_curr = ctx.ind("macd_hist_15m")
-        macd_prev1 = ctx.prev("macd_hist_15m", 1, None)
-        macd_prev2 = ctx.prev("macd_hist_15m", 2, None)
-        macd_up = _macd_ok(macd_curr, macd_prev1, macd_prev2, "LONG")
-        macd_down = _macd_ok(macd_curr, macd_prev1, macd_prev2, "SHORT")
-        cond_long.append(
-            item(
-                "LONG",
-                "15m",
-                macd_up,
-                f"MACD柱上升 p2={_fmt(macd_prev2,3)} p1={_fmt(macd_prev1,3)} now={_fmt(macd_curr,3)}",
-            )
+        price_long = _price_ok_long(ctx.close_15m, ctx.low_15m, ema20_15m, ema60_15m)
+        price_short = _price_ok_short(ctx.close_15m, ctx.high_15m, ema20_15m, ema60_15m)
+        band_long, band_short = p.rsi_bands(rsi_curr)
+        rsi_long = _rsi_ok(rsi_curr, rsi_prev, SIDE_LONG, band_long, p.rsi_slope_required)
+        rsi_short = _rsi_ok(rsi_curr, rsi_prev, SIDE_SHORT, band_short, p.rsi_slope_required)
+        macd_up = _macd_ok(macd_curr, macd_prev1, macd_prev2, SIDE_LONG)
+        macd_down = _macd_ok(macd_curr, macd_prev1, macd_prev2, SIDE_SHORT)
+
+        # each number shared by the long/short texts is formatted once
+        e20_s = _fmt(ema20_15m)
+        e60_s = _fmt(ema60_15m)
+        rsi_s = _fmt(rsi_curr, 2)
+        delta = _rsi_delta(rsi_curr, rsi_prev)
+        macd_s = (_fmt(macd_prev2, 3), _fmt(macd_prev1, 3), _fmt(macd_curr, 3))
+        price_15m = _cond_pair(
+            "15m",
+            price_long,
+            price_short,
+            _DESC_PRICE_LONG(e20_s, e60_s),
+            _DESC_PRICE_SHORT(e20_s, e60_s),
         )
-        cond_short.append(
-            item(
-                "SHORT",
-                "15m",
-                macd_down,
-                f"MACD柱下降 p2={_fmt(macd_prev2,3)} p1={_fmt(macd_prev1,3)} now={_fmt(macd_curr,3)}",
-            )
+        rsi_15m = _cond_pair(
+            "15m",
+            rsi_long,
+            rsi_short,
+            _DESC_RSI(rsi_s, p.rsi_long_lower, p.rsi_long_upper, delta),
+            _DESC_RSI(rsi_s, p.rsi_short_lower, p.rsi_short_upper, delta),
+        )
+        macd_15m = _cond_pair(
+            "15m",
+            macd_up,
+            macd_down,
+            _DESC_MACD_UP(*macd_s),
+            _DESC_MACD_DOWN(*macd_s),
         )
 
-        return {"long": cond_long, "short": cond_short}
+        pairs = (dir_1h, strength_1h, price_15m, rsi_15m, macd_15m)
+        result = {"long": [lp for lp, _ in pairs], "short": [sp for _, sp in pairs]}
+        self._describe_cache = (key, result)
+        return result
 
     def on_state_restore(self, ctx: StrategyContext) -> None:
         # Placeholder for restoring per-strategy state if needed
         return
 
     def on_bar_close(self, ctx: StrategyContext) -> EntrySignal | ExitAction | None:
-        return _on_15m_close(ctx)
+        # position and cooldown bars return before any params/indicator work
+        pos = ctx.position
+        if pos is not None:
+            return _on_position_bar_close(ctx, pos)
+        if ctx.cooldown_bars_remaining > 0:
+            return None
+        return _on_15m_close(ctx, self._params(ctx))
 
     def on_tick(self, ctx: StrategyContext, price: float) -> ExitAction | None:
         return _on_realtime_update(ctx, price)
 
+    def on_tick_entry(self, ctx: StrategyContext, price: float) -> EntrySignal | None:
+        return None
 
-def _on_15m_close(ctx: StrategyContext) -> EntrySignal | ExitAction | None:
-    params = ctx.meta.get("params", {}) or {}
-    trend_strength_min = params.get("trend_strength_min", 0.0)
-    rsi_long_lower = params.get("rsi_long_lower", 50.0)
-    rsi_long_upper = params.get("rsi_long_upper", 60.0)
-    rsi_short_upper = params.get("rsi_short_upper", 50.0)
-    rsi_short_lower = params.get("rsi_short_lower", 40.0)
-    rsi_slope_required = params.get("rsi_slope_required", False)
-    atr_mult = params.get("atr_stop_mult", 1.5)
+    def on_tick_exit(self, ctx: StrategyContext, price: float) -> ExitAction | None:
+        return _on_realtime_update(ctx, price)
 
-    if ctx.position is not None:
-        pos = ctx.position
-        ema20 = ctx.ind("ema20_15m")
-        rsi14 = ctx.ind("rsi14_15m")
-        if pos.side == "LONG" and ctx.close_15m < (ema20 or ctx.close_15m) and (rsi14 or 0) < 50:
-            return ExitAction(action="CLOSE_ALL", price=ctx.close_15m, reason="trend_fail")
-        if pos.side == "SHORT" and ctx.close_15m > (ema20 or ctx.close_15m) and (rsi14 or 0) > 50:
-            return ExitAction(action="CLOSE_ALL", price=ctx.close_15m, reason="trend_fail")
-        return None
 
-    # cooldown after stop
-    if ctx.cooldown_bars_remaining > 0:
-        return None
+def _on_position_bar_close(ctx: StrategyContext, pos: PositionState) -> ExitAction | None:
+    # only ema20/rsi are needed here, so skip building the full indicator view
+    c = ctx.close_15m
+    ema20 = _f(ctx.ind("ema20_15m"))
+    # a missing RSI counts as 0: below 50, so it confirms a LONG trend failure
+    rsi = ctx.ind("rsi14_15m") or 0.0
+    if pos.is_long and c < ema20 and rsi < 50:
+        return ExitAction(action="CLOSE_ALL", price=c, reason="trend_fail")
+    if not pos.is_long and c > ema20 and rsi > 50:
+        return ExitAction(action="CLOSE_ALL", price=c, reason="trend_fail")
+    return None
 
-    ind1_close = ctx.ind("close_1h")
-    ind1_ema20 = ctx.ind("ema20_1h")
-    ind1_ema60 = ctx.ind("ema60_1h")
-    ind1_rsi = ctx.ind("rsi14_1h")
-    strength = _trend_strength(ind1_ema20, ind1_ema60, ind1_close)
-    long_dir = _trend_direction_ok(ind1_close, ind1_ema20, ind1_ema60, ind1_rsi, "LONG")
-    short_dir = _trend_direction_ok(ind1_close, ind1_ema20, ind1_ema60, ind1_rsi, "SHORT")
-    allow_long = long_dir and strength >= trend_strength_min
-    allow_short = short_dir and strength >= trend_strength_min
-
-    # Long setup
-    if allow_long:
-        signal = _entry_signal(
-            ctx,
-            "LONG",
-            rsi_long_lower,
-            rsi_long_upper,
-            rsi_slope_required,
-            atr_mult,
-        )
-        if signal is not None:
-            return signal
-
-    # Short setup
-    if allow_short:
-        signal = _entry_signal(
-            ctx,
-            "SHORT",
-            rsi_short_lower,
-            rsi_short_upper,
-            rsi_slope_required,
-            atr_mult,
-        )
-        if signal is not None:
-            return signal
 
+def _on_15m_close(ctx: StrategyContext, p: StrategyParams) -> EntrySignal | None:
+    """Entry decision for a flat, non-cooldown bar (see TestStrategy.on_bar_close)."""
+    iv = ctx.view()
+    c = ctx.close_15m
+    ema20 = _f(iv.ema20_15m)
+    rsi = _f(iv.rsi14_15m)
+    rsi_prev, macd_prev1, macd_prev2 = _prev_inputs(ctx)
+    args = (
+        c,
+        ctx.low_15m,
+        ctx.high_15m,
+        ema20,
+        _f(iv.ema60_15m),
+        rsi,
+        rsi_prev,
+        _f(iv.macd_hist_15m),
+        macd_prev1,
+        macd_prev2,
+        _f(iv.atr14_15m),
+        _f(ctx.structure_stop),
+    )
+    side_code, entry, stop, tp1, tp2 = _eval_bar(
+        *args, iv.close_1h or 0.0, iv.ema20_1h or 0.0, iv.ema60_1h or 0.0, iv.rsi14_1h or 0.0, p.kernel
+    )
+    if side_code:
+        return _entry_from_code(side_code, entry, stop, tp1, tp2)
     return None
 
 
@@ -323,7 +590,7 @@ def _on_realtime_update(ctx: StrategyContext, price: float) -> ExitAction | None
     if pos is None:
         return None
 
-    if pos.side == "LONG":
+    if pos.is_long:
         if price <= pos.stop_price:
             return ExitAction(action="STOP", price=pos.stop_price, reason="stop")
         if not pos.tp1_hit and price >= pos.tp1_price:
@@ -339,45 +606,3 @@ def _on_realtime_update(ctx: StrategyContext, price: float) -> ExitAction | None
             return ExitAction(action="TP2", price=pos.tp2_price, reason="tp2")
 
     return None
-
-
-def _entry_signal(
-    ctx: StrategyContext,
-    side: str,
-    rsi_lower: float,
-    rsi_upper: float,
-    rsi_slope_required: bool,
-    atr_mult: float,
-) -> EntrySignal | None:
-    rsi_curr = ctx.ind("rsi14_15m")
-    rsi_prev = ctx.prev("rsi14_15m", 1, None)
-    macd_curr = ctx.ind("macd_hist_15m")
-    macd_prev1 = ctx.prev("macd_hist_15m", 1, None)
-    macd_prev2 = ctx.prev("macd_hist_15m", 2, None)
-    ema20 = ctx.ind("ema20_15m")
-    ema60 = ctx.ind("ema60_15m")
-    atr15 = ctx.ind("atr14_15m")
-
-    rsi_ok = _rsi_ok(rsi_curr, rsi_prev, side, rsi_lower, rsi_upper, rsi_slope_required)
-    price_ok = _price_ok(ctx, ema20, ema60, side)
-    macd_ok = _macd_ok(macd_curr, macd_prev1, macd_prev2, side)
-
-    if not (rsi_ok and price_ok and macd_ok):
-        return None
-
-    entry = ctx.close_15m
-    if side == "LONG":
-        stop = _choose_stop_long(entry, atr15, ctx.structure_stop, atr_mult)
-        reason = "signal_long"
-    else:
-        stop = _choose_stop_short(entry, atr15, ctx.structure_stop, atr_mult)
-        reason = "signal_short"
-    tp1, tp2 = _calc_targets(entry, stop)
-    return EntrySignal(
-        side=side,
-        entry_price=entry,
-        stop_price=stop,
-        tp1_price=tp1,
-        tp2_price=tp2,
-        reason=reason,
-    )
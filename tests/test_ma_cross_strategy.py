@@ -0,0 +1,44 @@
+import unittest
+
+from backend.strategy.interfaces import StrategyContext
+from backend.strategy.ma_cross_strategy import MaCrossStrategy
+from backend.strategy.runner import StrategyRunner
+
+
+def _bar_ctx(ema20: float, ema60: float) -> StrategyContext:
+    return StrategyContext(
+        close_15m=100.0,
+        low_15m=99.0,
+        high_15m=101.0,
+        indicators={"ema20_15m": ema20, "ema60_15m": ema60, "rsi14_1h": 60.0, "atr14_15m": 1.0},
+    )
+
+
+BELOW = (99.0, 100.0)
+ABOVE = (101.0, 100.0)
+
+
+class CrossoverTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.strategy = MaCrossStrategy()
+        self.strategy.configure({})
+
+    def test_entry_only_on_cross_bar(self) -> None:
+        self.assertIsNone(self.strategy.on_bar_close(_bar_ctx(*BELOW)))
+        sig = self.strategy.on_bar_close(_bar_ctx(*ABOVE))
+        self.assertIsNotNone(sig)
+        self.assertEqual(sig.side, "LONG")
+        self.assertIsNone(self.strategy.on_bar_close(_bar_ctx(*ABOVE)))
+
+    def test_first_bar_does_not_enter(self) -> None:
+        self.assertIsNone(self.strategy.on_bar_close(_bar_ctx(*ABOVE)))
+
+    def test_runner_reset_clears_previous_relation(self) -> None:
+        runner = StrategyRunner({"ma": self.strategy}, {}, None, None, None, None)
+        self.strategy.on_bar_close(_bar_ctx(*BELOW))
+        runner.reset_strategy("ma")
+        self.assertIsNone(self.strategy.on_bar_close(_bar_ctx(*ABOVE)))
+
+
+if __name__ == "__main__":
+    unittest.main()
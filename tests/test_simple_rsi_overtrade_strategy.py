@@ -0,0 +1,34 @@
+import unittest
+
+from backend.strategy.interfaces import PositionState, StrategyContext
+from backend.strategy.simple_rsi_overtrade_strategy import SimpleRsiOvertradeStrategy
+
+
+class ExitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.strategy = SimpleRsiOvertradeStrategy()
+
+    def _exit(self, ctx: StrategyContext, price: float):
+        action = self.strategy.on_tick(ctx, price)
+        return action and (action.action, action.price)
+
+    def test_long_and_short_levels(self) -> None:
+        long_ctx = StrategyContext(position=PositionState("LONG", 100.0, 1.0, 95.0, 110.0, 110.0, False))
+        self.assertEqual(self._exit(long_ctx, 94.0), ("STOP", 95.0))
+        self.assertEqual(self._exit(long_ctx, 111.0), ("TP2", 110.0))
+        self.assertIsNone(self._exit(long_ctx, 100.0))
+        short_ctx = StrategyContext(position=PositionState("SHORT", 100.0, 1.0, 105.0, 90.0, 90.0, False))
+        self.assertEqual(self._exit(short_ctx, 106.0), ("STOP", 105.0))
+        self.assertEqual(self._exit(short_ctx, 89.0), ("TP2", 90.0))
+        self.assertIsNone(self._exit(short_ctx, 100.0))
+
+    def test_moved_target_on_same_position(self) -> None:
+        pos = PositionState("LONG", 100.0, 1.0, 95.0, 110.0, 110.0, False)
+        ctx = StrategyContext(position=pos)
+        self.assertIsNone(self._exit(ctx, 108.0))
+        pos.tp2_price = 107.0
+        self.assertEqual(self._exit(ctx, 108.0), ("TP2", 107.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
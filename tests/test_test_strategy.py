@@ -0,0 +1,156 @@
+import math
+import unittest
+
+from backend.strategy.interfaces import PositionState, StrategyContext
+from backend.strategy.test_strategy import TestStrategy
+
+
+def _long_setup_ctx(**overrides) -> StrategyContext:
+    """A flat 15m close that meets every long condition under the default params."""
+    indicators = {
+        "close_15m": 100.0,
+        "ema20_15m": 99.5,
+        "ema60_15m": 98.0,
+        "rsi14_15m": 55.0,
+        "macd_hist_15m": 0.3,
+        "atr14_15m": 1.0,
+        "close_1h": 110.0,
+        "ema20_1h": 105.0,
+        "ema60_1h": 100.0,
+        "rsi14_1h": 60.0,
+    }
+    indicators.update(overrides)
+    return StrategyContext(
+        close_15m=100.0,
+        low_15m=99.0,
+        high_15m=101.0,
+        indicators=indicators,
+        history={"rsi14_15m": [54.0], "macd_hist_15m": [0.1, 0.2]},
+    )
+
+
+def _short_setup_ctx(**overrides) -> StrategyContext:
+    indicators = {
+        "close_15m": 100.0,
+        "ema20_15m": 100.5,
+        "ema60_15m": 102.0,
+        "rsi14_15m": 45.0,
+        "macd_hist_15m": 0.1,
+        "atr14_15m": 1.0,
+        "close_1h": 90.0,
+        "ema20_1h": 95.0,
+        "ema60_1h": 100.0,
+        "rsi14_1h": 40.0,
+    }
+    indicators.update(overrides)
+    return StrategyContext(
+        close_15m=100.0,
+        low_15m=99.0,
+        high_15m=101.0,
+        indicators=indicators,
+        history={"rsi14_15m": [46.0], "macd_hist_15m": [0.3, 0.2]},
+    )
+
+
+class EntryLevelsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.strategy = TestStrategy()
+
+    def test_long_setup_enters(self) -> None:
+        sig = self.strategy.on_bar_close(_long_setup_ctx())
+        self.assertIsNotNone(sig)
+        self.assertEqual(sig.side, "LONG")
+        self.assertEqual(sig.stop_price, 98.5)
+        self.assertEqual((sig.tp1_price, sig.tp2_price), (101.5, 103.0))
+
+    def test_missing_atr_does_not_enter(self) -> None:
+        self.assertIsNone(self.strategy.on_bar_close(_long_setup_ctx(atr14_15m=None)))
+
+    def test_missing_atr_with_structure_stop_does_not_enter(self) -> None:
+        ctx = _long_setup_ctx(atr14_15m=None)
+        ctx.structure_stop = 97.0
+        self.assertIsNone(self.strategy.on_bar_close(ctx))
+
+    def test_infinite_atr_does_not_enter(self) -> None:
+        self.assertIsNone(self.strategy.on_bar_close(_long_setup_ctx(atr14_15m=math.inf)))
+
+    def test_infinite_structure_stop_does_not_enter(self) -> None:
+        ctx = _long_setup_ctx()
+        ctx.structure_stop = -math.inf
+        self.assertIsNone(self.strategy.on_bar_close(ctx))
+        ctx = _short_setup_ctx()
+        ctx.structure_stop = math.inf
+        self.assertIsNone(self.strategy.on_bar_close(ctx))
+
+    def test_entry_levels_are_finite(self) -> None:
+        sig = self.strategy.on_bar_close(_long_setup_ctx())
+        for v in (sig.entry_price, sig.stop_price, sig.tp1_price, sig.tp2_price):
+            self.assertTrue(math.isfinite(v))
+
+
+class MissingValuesTest(unittest.TestCase):
+    """Missing indicator values keep their original (`x or 0`) meaning."""
+
+    def setUp(self) -> None:
+        self.strategy = TestStrategy()
+
+    def _position_ctx(self, side: str, rsi) -> StrategyContext:
+        ctx = StrategyContext(
+            close_15m=100.0,
+            low_15m=99.0,
+            high_15m=101.0,
+            indicators={"ema20_15m": 101.0 if side == "LONG" else 99.0, "rsi14_15m": rsi},
+        )
+        ctx.position = PositionState(side, 102.0, 1.0, 95.0, 105.0, 110.0, False)
+        return ctx
+
+    def test_long_trend_fail_with_missing_rsi(self) -> None:
+        action = self.strategy.on_bar_close(self._position_ctx("LONG", None))
+        self.assertIsNotNone(action)
+        self.assertEqual((action.action, action.reason), ("CLOSE_ALL", "trend_fail"))
+
+    def test_short_trend_fail_needs_rsi(self) -> None:
+        self.assertIsNone(self.strategy.on_bar_close(self._position_ctx("SHORT", None)))
+
+    def test_short_entry_with_missing_1h_rsi(self) -> None:
+        sig = self.strategy.on_bar_close(_short_setup_ctx(rsi14_1h=None))
+        self.assertIsNotNone(sig)
+        self.assertEqual(sig.side, "SHORT")
+
+    def test_long_entry_blocked_by_missing_1h_rsi(self) -> None:
+        self.assertIsNone(self.strategy.on_bar_close(_long_setup_ctx(rsi14_1h=None)))
+
+    def test_describe_matches_entry_filter(self) -> None:
+        d = self.strategy.describe_conditions(_short_setup_ctx(rsi14_1h=None), True, False, 0)
+        self.assertTrue(d["short"][0]["ok"])
+
+
+class TickExitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.strategy = TestStrategy()
+
+    def _exit(self, side: str, price: float, tp1_hit: bool = False):
+        levels = (95.0, 105.0, 110.0) if side == "LONG" else (105.0, 95.0, 90.0)
+        ctx = StrategyContext(position=PositionState(side, 100.0, 1.0, *levels, tp1_hit))
+        action = self.strategy.on_tick(ctx, price)
+        return action and (action.action, action.price)
+
+    def test_long_levels(self) -> None:
+        self.assertEqual(self._exit("LONG", 94.0), ("STOP", 95.0))
+        self.assertEqual(self._exit("LONG", 106.0), ("TP1", 105.0))
+        self.assertEqual(self._exit("LONG", 106.0, tp1_hit=True), None)
+        self.assertEqual(self._exit("LONG", 111.0, tp1_hit=True), ("TP2", 110.0))
+        self.assertIsNone(self._exit("LONG", 100.0))
+
+    def test_short_levels(self) -> None:
+        self.assertEqual(self._exit("SHORT", 106.0), ("STOP", 105.0))
+        self.assertEqual(self._exit("SHORT", 94.0), ("TP1", 95.0))
+        self.assertEqual(self._exit("SHORT", 89.0, tp1_hit=True), ("TP2", 90.0))
+        self.assertIsNone(self._exit("SHORT", 100.0))
+
+    def test_flat_has_no_exit(self) -> None:
+        self.assertIsNone(self.strategy.on_tick(StrategyContext(), 100.0))
+
+
+if __name__ == "__main__":
+    unittest.main()